@@ -0,0 +1,84 @@
+import asyncio
+import random
+import time
+from typing import List
+
+import sqlalchemy
+
+from llama_index.schema import TextNode
+from llama_index.vector_stores import PGVectorStore
+from llama_index.vector_stores.types import NodeWithEmbedding
+
+# requires a running postgres with the pgvector extension available, see
+# https://github.com/pgvector/pgvector#installation-notes
+PARAMS = dict(
+    host="localhost",
+    port=5432,
+    database="postgres",
+    user="postgres",
+    password="password",
+)
+TABLE_NAME = "bench_lorem_ipsum"
+
+
+def generate_vectors(
+    num_vectors: int = 100, embedding_length: int = 1536
+) -> List[NodeWithEmbedding]:
+    random.seed(42)  # Make this reproducible
+    return [
+        NodeWithEmbedding(
+            node=TextNode(text=f"synthetic fox number {i}"),
+            embedding=[random.uniform(0, 1) for _ in range(embedding_length)],
+        )
+        for i in range(num_vectors)
+    ]
+
+
+def execute(vector_store: PGVectorStore, statement: str) -> None:
+    with vector_store._session() as session:
+        with session.begin():
+            session.execute(sqlalchemy.text(statement))
+
+
+def bench_postgres_vector_store(
+    num_vectors: List[int] = [100, 1000, 10000], embedding_length: int = 1536
+) -> None:
+    """Benchmark PGVectorStore ingestion: bulk INSERT versus COPY."""
+    print("Benchmarking PGVectorStore\n---------------------------")
+    vector_store = PGVectorStore.from_params(
+        **PARAMS,  # type: ignore
+        table_name=TABLE_NAME,
+        hybrid_search=True,
+        embed_dim=embedding_length,
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        for num_vector in num_vectors:
+            vectors = generate_vectors(
+                num_vectors=num_vector, embedding_length=embedding_length
+            )
+
+            for name, add in [
+                ("add", vector_store.add),
+                ("async_add", vector_store.async_add),
+                ("bulk_copy_add", vector_store.bulk_copy_add),
+                ("async_bulk_copy_add", vector_store.async_bulk_copy_add),
+            ]:
+                execute(vector_store, f"TRUNCATE TABLE data_{TABLE_NAME}")
+                time1 = time.time()
+                result = add(vectors)
+                if asyncio.iscoroutine(result):
+                    loop.run_until_complete(result)
+                time2 = time.time()
+                print(
+                    f"Adding {num_vector} vectors with {name} "
+                    f"took {time2 - time1} seconds"
+                )
+        execute(vector_store, f"DROP TABLE data_{TABLE_NAME}")
+    finally:
+        loop.run_until_complete(vector_store.close())
+        loop.close()
+
+
+if __name__ == "__main__":
+    bench_postgres_vector_store()
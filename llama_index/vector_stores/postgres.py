@@ -1,5 +1,9 @@
+import csv
+import io
+import json
 import logging
-from typing import List, Any, Type, Optional
+import struct
+from typing import Dict, List, Any, Tuple, Type, Optional
 from collections import namedtuple
 
 from llama_index.schema import MetadataMode, TextNode
@@ -63,8 +67,9 @@ def get_data_model(
 
         model = type(class_name, (HybridAbstractData,), {"__tablename__": tablename})
 
+        # index names are unique per schema, so scope it to the table
         Index(
-            "text_search_tsv_idx",
+            f"{tablename}_text_search_tsv_idx",
             model.text_search_tsv,  # type: ignore
             postgresql_using="gin",
         )
@@ -197,39 +202,122 @@ class PGVectorStore(VectorStore):
                 session.execute(statement)
                 session.commit()
 
-    def _node_to_table_row(self, node: NodeWithEmbedding) -> Any:
-        return self.table_class(
-            node_id=node.id,
-            embedding=node.embedding,
-            text=node.node.get_content(metadata_mode=MetadataMode.NONE),
-            metadata_=node_to_metadata_dict(
+    def _node_to_table_row(self, node: NodeWithEmbedding) -> Dict[str, Any]:
+        return {
+            "node_id": node.id,
+            "embedding": node.embedding,
+            "text": node.node.get_content(metadata_mode=MetadataMode.NONE),
+            "metadata_": node_to_metadata_dict(
                 node.node,
                 remove_text=True,
                 flat_metadata=self.flat_metadata,
             ),
-        )
+        }
 
     def add(self, embedding_results: List[NodeWithEmbedding]) -> List[str]:
-        ids = []
+        from sqlalchemy import insert
+
+        if not embedding_results:
+            return []
+
+        # a single executemany INSERT rather than one INSERT per node
+        rows = [self._node_to_table_row(result) for result in embedding_results]
         with self._session() as session:
             with session.begin():
-                for result in embedding_results:
-                    ids.append(result.id)
-                    item = self._node_to_table_row(result)
-                    session.add(item)
+                session.execute(insert(self.table_class), rows)
                 session.commit()
-        return ids
+        return [result.id for result in embedding_results]
 
     async def async_add(self, embedding_results: List[NodeWithEmbedding]) -> List[str]:
-        ids = []
+        from sqlalchemy import insert
+
+        if not embedding_results:
+            return []
+
+        rows = [self._node_to_table_row(result) for result in embedding_results]
         async with self._async_session() as session:
             async with session.begin():
-                for result in embedding_results:
-                    ids.append(result.id)
-                    item = self._node_to_table_row(result)
-                    session.add(item)
+                await session.execute(insert(self.table_class), rows)
                 await session.commit()
-        return ids
+        return [result.id for result in embedding_results]
+
+    def _copy_columns_and_records(
+        self, embedding_results: List[NodeWithEmbedding]
+    ) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        columns = ["node_id", "text", "metadata_", "embedding"]
+        records = []
+        for result in embedding_results:
+            row = self._node_to_table_row(result)
+            row["metadata_"] = json.dumps(row["metadata_"])
+            records.append(tuple(row[column] for column in columns))
+        return columns, records
+
+    def bulk_copy_add(self, embedding_results: List[NodeWithEmbedding]) -> List[str]:
+        """Add embedding results with a single COPY ... FROM STDIN stream.
+
+        Meant for large ingests, where a COPY is considerably faster than
+        even a multi-row INSERT.
+        """
+        if not embedding_results:
+            return []
+
+        columns, records = self._copy_columns_and_records(embedding_results)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        for node_id, text, metadata, embedding in records:
+            vector = "[" + ",".join(str(value) for value in embedding) + "]"
+            writer.writerow([node_id, text, metadata, vector])
+        buffer.seek(0)
+
+        stmt = (
+            f"COPY public.{self.table_class.__tablename__} ({', '.join(columns)}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        dbapi_conn = self._engine.raw_connection()
+        try:
+            cursor: Any = dbapi_conn.cursor()
+            try:
+                cursor.copy_expert(stmt, buffer)
+            finally:
+                cursor.close()
+            dbapi_conn.commit()
+        finally:
+            dbapi_conn.close()
+        return [result.id for result in embedding_results]
+
+    async def async_bulk_copy_add(
+        self, embedding_results: List[NodeWithEmbedding]
+    ) -> List[str]:
+        """Asynchronously add embedding results with a single binary COPY.
+
+        The binary vector codec the COPY needs is registered on the raw asyncpg
+        connection, which is invalidated afterwards so it never goes back to
+        the pool used for queries.
+        """
+        if not embedding_results:
+            return []
+
+        columns, records = self._copy_columns_and_records(embedding_results)
+        async with self._async_engine.connect() as conn:
+            try:
+                raw_conn = await conn.get_raw_connection()
+                asyncpg_conn: Any = raw_conn.driver_connection
+                await asyncpg_conn.set_type_codec(
+                    "vector",
+                    schema="public",
+                    encoder=_encode_vector_binary,
+                    decoder=_decode_vector_binary,
+                    format="binary",
+                )
+                await asyncpg_conn.copy_records_to_table(
+                    self.table_class.__tablename__,
+                    records=records,
+                    columns=columns,
+                    schema_name="public",
+                )
+            finally:
+                await conn.invalidate()
+        return [result.id for result in embedding_results]
 
     def _apply_filters_and_limit(
         self,
@@ -492,6 +580,16 @@ class PGVectorStore(VectorStore):
                 session.commit()
 
 
+def _encode_vector_binary(value: List[float]) -> bytes:
+    # pgvector's binary format: int16 dimensions, int16 unused, float4 values
+    return struct.pack(f">HH{len(value)}f", len(value), 0, *value)
+
+
+def _decode_vector_binary(data: bytes) -> List[float]:
+    dim, _ = struct.unpack_from(">HH", data)
+    return list(struct.unpack_from(f">{dim}f", data, 4))
+
+
 def _dedup_results(results: List[DBEmbeddingRow]) -> List[DBEmbeddingRow]:
     seen_ids = set()
     deduped_results = []
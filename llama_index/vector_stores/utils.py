@@ -29,7 +29,8 @@ def node_to_metadata_dict(
     flat_metadata: bool = False,
 ) -> dict:
     """Common logic for saving Node data into metadata dict."""
-    metadata: Dict[str, Any] = node.metadata
+    # copy so adding the same node twice doesn't nest `_node_content`
+    metadata: Dict[str, Any] = dict(node.metadata)
 
     if flat_metadata:
         _validate_is_flat_dict(metadata)
@@ -26,6 +26,16 @@ from tests.mock_utils.mock_text_splitter import patch_token_splitter_newline
 #     monkeypatch.setattr(socket, "socket", deny_network)
 
 
+# each worker opens its own postgres pools (see tests/vector_stores/test_postgres.py),
+# so cap `-n auto` to stay well below the server's `max_connections`
+MAX_XDIST_WORKERS = 4
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config: pytest.Config) -> int:
+    return min(os.cpu_count() or 1, MAX_XDIST_WORKERS)
+
+
 @pytest.fixture
 def allow_networking(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.undo()
@@ -1,5 +1,7 @@
 import asyncio
-from typing import Any, Dict, Generator, List, Union
+import functools
+import os
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Tuple, Union
 
 import pytest
 
@@ -11,6 +13,7 @@ from llama_index.vector_stores.types import (
     NodeWithEmbedding,
     VectorStoreQuery,
     VectorStoreQueryMode,
+    VectorStoreQueryResult,
 )
 
 # from testing find install here https://github.com/pgvector/pgvector#installation-notes
@@ -19,91 +22,163 @@ from llama_index.vector_stores.types import (
 PARAMS: Dict[str, Union[str, int]] = dict(
     host="localhost", user="postgres", password="password", port=5432
 )
-TEST_DB = "test_vector_db"
+# each pytest-xdist worker gets its own database so `-n` runs don't collide;
+# `-n auto` is capped in tests/conftest.py since every worker holds its own pools
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DB = f"test_vector_db_{_WORKER_ID}"
 TEST_TABLE_NAME = "lorem_ipsum"
+TEST_TABLE_NAME_HYBRID = "lorem_ipsum_hybrid"
+TEST_TABLE_NAME_HYBRID_SEEDED = "lorem_ipsum_hybrid_seeded"
+TEST_TABLE_NAME_DEFAULT_DIM = "lorem_ipsum_default_dim"
 TEST_EMBED_DIM = 2
 
 
-try:
-    import asyncpg  # noqa: F401
-    import pgvector  # noqa: F401
-    import psycopg2  # noqa: F401
-    import sqlalchemy  # noqa: F401
-    import sqlalchemy.ext.asyncio  # noqa: F401
+pytest.importorskip("asyncpg")
+pytest.importorskip("pgvector")
+pytest.importorskip("sqlalchemy.ext.asyncio")
+psycopg2 = pytest.importorskip("psycopg2")
 
-    # connection check
-    conn__ = psycopg2.connect(**PARAMS)  # type: ignore
-    conn__.close()
 
-    postgres_not_available = False
-except (ImportError, Exception):
-    postgres_not_available = True
+@functools.lru_cache(maxsize=1)
+def _pg_available() -> bool:
+    """Probe the server once, and only when a test in this module is run."""
+    try:
+        psycopg2.connect(**PARAMS).close()  # type: ignore
+    except Exception:
+        return False
+    return True
 
 
-def _get_sample_vector(num: float) -> List[float]:
+# a string condition is evaluated lazily by pytest, not at import
+pytestmark = pytest.mark.skipif(
+    "not _pg_available()", reason="postgres db is not available"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sample_vector(num: float) -> Tuple[float, ...]:
     """
-    Get sample embedding vector of the form [num, 1, 1, ..., 1]
+    Get sample embedding vector of the form (num, 1, 1, ..., 1)
     where the length of the vector is TEST_EMBED_DIM.
+
+    The result is cached and immutable; wrap it in ``list`` where a
+    ``List[float]`` is expected.
     """
-    return [num] + [1.0] * (TEST_EMBED_DIM - 1)
+    return tuple([num] + [1.0] * (TEST_EMBED_DIM - 1))
+
+
+def _make_store(
+    database: str, table_name: str, hybrid_search: bool = False
+) -> PGVectorStore:
+    return PGVectorStore.from_params(
+        **PARAMS,  # type: ignore
+        database=database,
+        table_name=table_name,
+        hybrid_search=hybrid_search,
+        embed_dim=TEST_EMBED_DIM,
+    )
 
 
-@pytest.fixture(scope="session")
-def conn() -> Any:
-    import psycopg2
+@pytest.fixture(scope="module")
+def event_loop() -> Generator:
+    """
+    Share one event loop across the module so async tests and fixture teardown
+    run on the loop the asyncpg connections were opened on.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
 
+@pytest.fixture(scope="module")
+def conn() -> Generator:
     conn_ = psycopg2.connect(**PARAMS)  # type: ignore
-    return conn_
+    # CREATE/DROP DATABASE cannot run inside a transaction
+    conn_.autocommit = True
+    yield conn_
+    conn_.close()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def db(conn: Any) -> Generator:
-    conn.autocommit = True
-
     with conn.cursor() as c:
         c.execute(f"DROP DATABASE IF EXISTS {TEST_DB}")
         c.execute(f"CREATE DATABASE {TEST_DB}")
-        conn.commit()
     yield
     with conn.cursor() as c:
         c.execute(f"DROP DATABASE {TEST_DB}")
-        conn.commit()
 
 
-@pytest.fixture
-def pg(db: None) -> Any:
-    pg = PGVectorStore.from_params(
-        **PARAMS,  # type: ignore
-        database=TEST_DB,
-        table_name=TEST_TABLE_NAME,
-        embed_dim=TEST_EMBED_DIM,
-    )
+@pytest.fixture(scope="module")
+def pg_store(
+    db: None,
+    event_loop: asyncio.AbstractEventLoop,
+    query_top1_one: VectorStoreQuery,
+    query_filtered: VectorStoreQuery,
+) -> Any:
+    pg = _make_store(TEST_DB, TEST_TABLE_NAME)
+    _warm_up(pg, event_loop, [query_top1_one, query_filtered])
 
     yield pg
 
-    asyncio.run(pg.close())
+    event_loop.run_until_complete(pg.close())
 
 
-@pytest.fixture
-def pg_hybrid(db: None) -> Any:
-    pg = PGVectorStore.from_params(
-        **PARAMS,  # type: ignore
-        database=TEST_DB,
-        table_name=TEST_TABLE_NAME,
-        hybrid_search=True,
-        embed_dim=TEST_EMBED_DIM,
-    )
+@pytest.fixture(scope="module")
+def pg_hybrid_store(
+    db: None,
+    event_loop: asyncio.AbstractEventLoop,
+    query_top1_ten: VectorStoreQuery,
+    hybrid_query_filtered: VectorStoreQuery,
+) -> Any:
+    pg = _make_store(TEST_DB, TEST_TABLE_NAME_HYBRID, hybrid_search=True)
+    _warm_up(pg, event_loop, [query_top1_ten, hybrid_query_filtered])
+
+    yield pg
+
+    event_loop.run_until_complete(pg.close())
+
+
+@pytest.fixture(scope="module")
+def pg_hybrid_seeded(
+    db: None,
+    event_loop: asyncio.AbstractEventLoop,
+    hybrid_node_embeddings: List[NodeWithEmbedding],
+    sparse_query_sentence: VectorStoreQuery,
+    hybrid_query_sparse_top1: VectorStoreQuery,
+) -> Any:
+    """
+    Store over `hybrid_node_embeddings`, added once for all read-only tests;
+    never mutate.
+    """
+    pg = _make_store(TEST_DB, TEST_TABLE_NAME_HYBRID_SEEDED, hybrid_search=True)
+    pg.add(hybrid_node_embeddings)
+    _warm_up(pg, event_loop, [sparse_query_sentence, hybrid_query_sparse_top1])
 
     yield pg
 
-    asyncio.run(pg.close())
+    event_loop.run_until_complete(pg.close())
+
 
+@pytest.fixture
+def pg(pg_store: PGVectorStore) -> Any:
+    yield pg_store
 
-@pytest.fixture(scope="session")
+    _truncate_table(pg_store)
+
+
+@pytest.fixture
+def pg_hybrid(pg_hybrid_store: PGVectorStore) -> Any:
+    yield pg_hybrid_store
+
+    _truncate_table(pg_hybrid_store)
+
+
+@pytest.fixture(scope="module")
 def node_embeddings() -> List[NodeWithEmbedding]:
     return [
         NodeWithEmbedding(
-            embedding=_get_sample_vector(1.0),
+            embedding=list(_get_sample_vector(1.0)),
             node=TextNode(
                 text="lorem ipsum",
                 id_="aaa",
@@ -111,7 +186,7 @@ def node_embeddings() -> List[NodeWithEmbedding]:
             ),
         ),
         NodeWithEmbedding(
-            embedding=_get_sample_vector(0.1),
+            embedding=list(_get_sample_vector(0.1)),
             node=TextNode(
                 text="dolor sit amet",
                 id_="bbb",
@@ -122,11 +197,11 @@ def node_embeddings() -> List[NodeWithEmbedding]:
     ]
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope="module")
 def hybrid_node_embeddings() -> List[NodeWithEmbedding]:
     return [
         NodeWithEmbedding(
-            embedding=_get_sample_vector(0.1),
+            embedding=list(_get_sample_vector(0.1)),
             node=TextNode(
                 text="lorem ipsum",
                 id_="aaa",
@@ -134,7 +209,7 @@ def hybrid_node_embeddings() -> List[NodeWithEmbedding]:
             ),
         ),
         NodeWithEmbedding(
-            embedding=_get_sample_vector(1.0),
+            embedding=list(_get_sample_vector(1.0)),
             node=TextNode(
                 text="dolor sit amet",
                 id_="bbb",
@@ -143,7 +218,7 @@ def hybrid_node_embeddings() -> List[NodeWithEmbedding]:
             ),
         ),
         NodeWithEmbedding(
-            embedding=_get_sample_vector(5.0),
+            embedding=list(_get_sample_vector(5.0)),
             node=TextNode(
                 text="The quick brown fox jumped over the lazy dog.",
                 id_="ccc",
@@ -151,7 +226,7 @@ def hybrid_node_embeddings() -> List[NodeWithEmbedding]:
             ),
         ),
         NodeWithEmbedding(
-            embedding=_get_sample_vector(10.0),
+            embedding=list(_get_sample_vector(10.0)),
             node=TextNode(
                 text="The fox and the hound",
                 id_="ddd",
@@ -162,244 +237,378 @@ def hybrid_node_embeddings() -> List[NodeWithEmbedding]:
     ]
 
 
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
+@pytest.fixture(scope="module")
+def metadata_filters() -> MetadataFilters:
+    return MetadataFilters(
+        filters=[ExactMatchFilter(key="test_key", value="test_value")]
+    )
+
+
+@pytest.fixture(scope="module")
+def query_top1_one() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(1.0)), similarity_top_k=1
+    )
+
+
+@pytest.fixture(scope="module")
+def query_top1_ten() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(10.0)), similarity_top_k=1
+    )
+
+
+@pytest.fixture(scope="module")
+def query_top1_point_one() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(0.1)), similarity_top_k=1
+    )
+
+
+@pytest.fixture(scope="module")
+def query_filtered(metadata_filters: MetadataFilters) -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(0.5)),
+        similarity_top_k=10,
+        filters=metadata_filters,
+    )
+
+
+@pytest.fixture(scope="module")
+def sparse_query_sentence() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(0.1)),
+        query_str="who is the fox?",
+        sparse_top_k=2,
+        mode=VectorStoreQueryMode.SPARSE,
+    )
+
+
+@pytest.fixture(scope="module")
+def hybrid_query_sparse_top1() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(0.1)),
+        query_str="fox",
+        similarity_top_k=2,
+        mode=VectorStoreQueryMode.HYBRID,
+        sparse_top_k=1,
+    )
+
+
+@pytest.fixture(scope="module")
+def hybrid_query_default_sparse_top_k() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(0.1)),
+        query_str="fox",
+        similarity_top_k=2,
+        mode=VectorStoreQueryMode.HYBRID,
+    )
+
+
+@pytest.fixture(scope="module")
+def hybrid_query_sentence() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(0.1)),
+        query_str="who is the fox?",
+        similarity_top_k=2,
+        mode=VectorStoreQueryMode.HYBRID,
+    )
+
+
+@pytest.fixture(scope="module")
+def hybrid_query_filtered(metadata_filters: MetadataFilters) -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(0.1)),
+        query_str="fox",
+        similarity_top_k=10,
+        filters=metadata_filters,
+        mode=VectorStoreQueryMode.HYBRID,
+    )
+
+
+@pytest.fixture(scope="module")
+def hybrid_query_no_query_str() -> VectorStoreQuery:
+    return VectorStoreQuery(
+        query_embedding=list(_get_sample_vector(1.0)),
+        similarity_top_k=10,
+        mode=VectorStoreQueryMode.HYBRID,
+    )
+
+
+class _SyncStoreAdapter:
+    """
+    Expose a store's sync ``add``/``query`` under the async method names, so one
+    async test body can exercise both code paths.
+    """
+
+    def __init__(self, store: PGVectorStore) -> None:
+        self._store = store
+
+    async def async_add(self, embedding_results: List[NodeWithEmbedding]) -> List[str]:
+        return self._store.add(embedding_results)
+
+    async def aquery(self, query: VectorStoreQuery) -> VectorStoreQueryResult:
+        return self._store.query(query)
+
+
+def _truncate_table(store: PGVectorStore) -> None:
+    import sqlalchemy
+
+    with store._session() as session:
+        with session.begin():
+            session.execute(
+                sqlalchemy.text(
+                    f"TRUNCATE TABLE data_{store.table_name} RESTART IDENTITY"
+                )
+            )
+
+
+def _count_rows(store: PGVectorStore) -> int:
+    import sqlalchemy
+
+    with store._session() as session:
+        return session.execute(
+            sqlalchemy.text(f"SELECT count(*) FROM data_{store.table_name}")
+        ).scalar_one()
+
+
+def _warm_up(
+    store: PGVectorStore,
+    loop: asyncio.AbstractEventLoop,
+    queries: List[VectorStoreQuery],
+) -> None:
+    """
+    Run each query shape once as soon as the store is created, so the compiled
+    statements and asyncpg's per-connection prepared statements are cached
+    before any test runs. Top k values are bound parameters, so one query per
+    mode and filter variant is enough.
+    """
+    for query in queries:
+        store.query(query)
+        loop.run_until_complete(store.aquery(query))
+
+
+async def _run_sync_and_async(
+    store: PGVectorStore, body: Callable[[Any], Awaitable[None]], reset: bool = True
+) -> None:
+    """
+    Run ``body`` against the async API of ``store`` and then against its sync
+    API, sharing one fixture setup between the two. With ``reset`` the table
+    is emptied in between; pass ``False`` for read-only bodies on seeded stores.
+    """
+    await body(store)
+    if reset:
+        _truncate_table(store)
+    await body(_SyncStoreAdapter(store))
+
+
 @pytest.mark.asyncio
 async def test_instance_creation(db: None) -> None:
     pg = PGVectorStore.from_params(
         **PARAMS,  # type: ignore
         database=TEST_DB,
-        table_name=TEST_TABLE_NAME,
+        table_name=TEST_TABLE_NAME_DEFAULT_DIM,
     )
     assert isinstance(pg, PGVectorStore)
     await pg.close()
 
 
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
 @pytest.mark.asyncio
-@pytest.mark.parametrize("use_async", [True, False])
 async def test_add_to_db_and_query(
-    pg: PGVectorStore, node_embeddings: List[NodeWithEmbedding], use_async: bool
+    pg: PGVectorStore,
+    node_embeddings: List[NodeWithEmbedding],
+    query_top1_one: VectorStoreQuery,
 ) -> None:
-    if use_async:
-        await pg.async_add(node_embeddings)
-    else:
-        pg.add(node_embeddings)
+    async def _body(store: Any) -> None:
+        await store.async_add(node_embeddings)
+        res = await store.aquery(query_top1_one)
+        assert res.nodes
+        assert len(res.nodes) == 1
+        assert res.nodes[0].node_id == "aaa"
+
     assert isinstance(pg, PGVectorStore)
-    q = VectorStoreQuery(query_embedding=_get_sample_vector(1.0), similarity_top_k=1)
-    if use_async:
-        res = await pg.aquery(q)
-    else:
-        res = pg.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 1
-    assert res.nodes[0].node_id == "aaa"
+    await _run_sync_and_async(pg, _body)
 
 
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
 @pytest.mark.asyncio
-@pytest.mark.parametrize("use_async", [True, False])
 async def test_add_to_db_and_query_with_metadata_filters(
-    pg: PGVectorStore, node_embeddings: List[NodeWithEmbedding], use_async: bool
+    pg: PGVectorStore,
+    node_embeddings: List[NodeWithEmbedding],
+    query_filtered: VectorStoreQuery,
 ) -> None:
-    if use_async:
-        await pg.async_add(node_embeddings)
-    else:
-        pg.add(node_embeddings)
+    async def _body(store: Any) -> None:
+        await store.async_add(node_embeddings)
+        res = await store.aquery(query_filtered)
+        assert res.nodes
+        assert len(res.nodes) == 1
+        assert res.nodes[0].node_id == "bbb"
+
     assert isinstance(pg, PGVectorStore)
-    filters = MetadataFilters(
-        filters=[ExactMatchFilter(key="test_key", value="test_value")]
-    )
-    q = VectorStoreQuery(
-        query_embedding=_get_sample_vector(0.5), similarity_top_k=10, filters=filters
-    )
-    if use_async:
-        res = await pg.aquery(q)
-    else:
-        res = pg.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 1
-    assert res.nodes[0].node_id == "bbb"
+    await _run_sync_and_async(pg, _body)
 
 
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
 @pytest.mark.asyncio
-@pytest.mark.parametrize("use_async", [True, False])
 async def test_add_to_db_query_and_delete(
-    pg: PGVectorStore, node_embeddings: List[NodeWithEmbedding], use_async: bool
+    pg: PGVectorStore,
+    node_embeddings: List[NodeWithEmbedding],
+    query_top1_point_one: VectorStoreQuery,
 ) -> None:
-    if use_async:
-        await pg.async_add(node_embeddings)
-    else:
-        pg.add(node_embeddings)
-    assert isinstance(pg, PGVectorStore)
+    async def _body(store: Any) -> None:
+        await store.async_add(node_embeddings)
 
-    q = VectorStoreQuery(query_embedding=_get_sample_vector(0.1), similarity_top_k=1)
+        res = await store.aquery(query_top1_point_one)
+        assert res.nodes
+        assert len(res.nodes) == 1
+        assert res.nodes[0].node_id == "bbb"
+        pg.delete("bbb")
 
-    if use_async:
-        res = await pg.aquery(q)
-    else:
-        res = pg.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 1
-    assert res.nodes[0].node_id == "bbb"
-    pg.delete("bbb")
+        res = await store.aquery(query_top1_point_one)
+        assert res.nodes
+        assert len(res.nodes) == 1
+        assert res.nodes[0].node_id == "aaa"
 
-    if use_async:
-        res = await pg.aquery(q)
-    else:
-        res = pg.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 1
-    assert res.nodes[0].node_id == "aaa"
+    assert isinstance(pg, PGVectorStore)
+    await _run_sync_and_async(pg, _body)
 
 
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
 @pytest.mark.asyncio
-@pytest.mark.parametrize("use_async", [True, False])
 async def test_sparse_query(
-    pg_hybrid: PGVectorStore,
-    hybrid_node_embeddings: List[NodeWithEmbedding],
-    use_async: bool,
+    pg_hybrid_seeded: PGVectorStore, sparse_query_sentence: VectorStoreQuery
 ) -> None:
-    if use_async:
-        await pg_hybrid.async_add(hybrid_node_embeddings)
-    else:
-        pg_hybrid.add(hybrid_node_embeddings)
-    assert isinstance(pg_hybrid, PGVectorStore)
+    async def _body(store: Any) -> None:
+        # text search should work when query is a sentence and not just a single word
+        res = await store.aquery(sparse_query_sentence)
+        assert res.nodes
+        assert len(res.nodes) == 2
+        assert res.nodes[0].node_id == "ccc"
+        assert res.nodes[1].node_id == "ddd"
 
-    # text search should work when query is a sentence and not just a single word
-    q = VectorStoreQuery(
-        query_embedding=_get_sample_vector(0.1),
-        query_str="who is the fox?",
-        sparse_top_k=2,
-        mode=VectorStoreQueryMode.SPARSE,
-    )
+    assert isinstance(pg_hybrid_seeded, PGVectorStore)
+    await _run_sync_and_async(pg_hybrid_seeded, _body, reset=False)
 
-    if use_async:
-        res = await pg_hybrid.aquery(q)
-    else:
-        res = pg_hybrid.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 2
-    assert res.nodes[0].node_id == "ccc"
-    assert res.nodes[1].node_id == "ddd"
 
-
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
 @pytest.mark.asyncio
-@pytest.mark.parametrize("use_async", [True, False])
 async def test_hybrid_query(
+    pg_hybrid_seeded: PGVectorStore,
+    hybrid_query_sparse_top1: VectorStoreQuery,
+    hybrid_query_default_sparse_top_k: VectorStoreQuery,
+    hybrid_query_sentence: VectorStoreQuery,
+) -> None:
+    async def _body(store: Any) -> None:
+        res = await store.aquery(hybrid_query_sparse_top1)
+        assert res.nodes
+        assert len(res.nodes) == 3
+        assert res.nodes[0].node_id == "aaa"
+        assert res.nodes[1].node_id == "bbb"
+        assert res.nodes[2].node_id == "ccc"
+
+        # if sparse_top_k is not specified, it should default to similarity_top_k
+        res = await store.aquery(hybrid_query_default_sparse_top_k)
+        assert res.nodes
+        assert len(res.nodes) == 4
+        assert res.nodes[0].node_id == "aaa"
+        assert res.nodes[1].node_id == "bbb"
+        assert res.nodes[2].node_id == "ccc"
+        assert res.nodes[3].node_id == "ddd"
+
+        # text search should work when query is a sentence and not just a single word
+        res = await store.aquery(hybrid_query_sentence)
+        assert res.nodes
+        assert len(res.nodes) == 4
+        assert res.nodes[0].node_id == "aaa"
+        assert res.nodes[1].node_id == "bbb"
+        assert res.nodes[2].node_id == "ccc"
+        assert res.nodes[3].node_id == "ddd"
+
+    assert isinstance(pg_hybrid_seeded, PGVectorStore)
+    await _run_sync_and_async(pg_hybrid_seeded, _body, reset=False)
+
+
+@pytest.mark.asyncio
+async def test_add_to_db_and_hybrid_query_with_metadata_filters(
     pg_hybrid: PGVectorStore,
     hybrid_node_embeddings: List[NodeWithEmbedding],
-    use_async: bool,
+    hybrid_query_filtered: VectorStoreQuery,
 ) -> None:
-    if use_async:
-        await pg_hybrid.async_add(hybrid_node_embeddings)
-    else:
-        pg_hybrid.add(hybrid_node_embeddings)
+    async def _body(store: Any) -> None:
+        await store.async_add(hybrid_node_embeddings)
+        res = await store.aquery(hybrid_query_filtered)
+        assert res.nodes
+        assert len(res.nodes) == 2
+        assert res.nodes[0].node_id == "bbb"
+        assert res.nodes[1].node_id == "ddd"
+
     assert isinstance(pg_hybrid, PGVectorStore)
+    await _run_sync_and_async(pg_hybrid, _body)
 
-    q = VectorStoreQuery(
-        query_embedding=_get_sample_vector(0.1),
-        query_str="fox",
-        similarity_top_k=2,
-        mode=VectorStoreQueryMode.HYBRID,
-        sparse_top_k=1,
-    )
 
-    if use_async:
-        res = await pg_hybrid.aquery(q)
-    else:
-        res = pg_hybrid.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 3
-    assert res.nodes[0].node_id == "aaa"
-    assert res.nodes[1].node_id == "bbb"
-    assert res.nodes[2].node_id == "ccc"
-
-    # if sparse_top_k is not specified, it should default to similarity_top_k
-    q = VectorStoreQuery(
-        query_embedding=_get_sample_vector(0.1),
-        query_str="fox",
-        similarity_top_k=2,
-        mode=VectorStoreQueryMode.HYBRID,
-    )
+@pytest.mark.asyncio
+async def test_add_uses_single_insert_round_trip(
+    pg_hybrid: PGVectorStore, hybrid_node_embeddings: List[NodeWithEmbedding]
+) -> None:
+    from sqlalchemy import event
 
-    if use_async:
-        res = await pg_hybrid.aquery(q)
-    else:
-        res = pg_hybrid.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 4
-    assert res.nodes[0].node_id == "aaa"
-    assert res.nodes[1].node_id == "bbb"
-    assert res.nodes[2].node_id == "ccc"
-    assert res.nodes[3].node_id == "ddd"
-
-    # text search should work when query is a sentence and not just a single word
-    q = VectorStoreQuery(
-        query_embedding=_get_sample_vector(0.1),
-        query_str="who is the fox?",
-        similarity_top_k=2,
-        mode=VectorStoreQueryMode.HYBRID,
-    )
+    inserts: List[str] = []
 
-    if use_async:
-        res = await pg_hybrid.aquery(q)
-    else:
-        res = pg_hybrid.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 4
-    assert res.nodes[0].node_id == "aaa"
-    assert res.nodes[1].node_id == "bbb"
-    assert res.nodes[2].node_id == "ccc"
-    assert res.nodes[3].node_id == "ddd"
+    def _count_inserts(
+        conn: Any, cursor: Any, statement: str, *args: Any, **kwargs: Any
+    ) -> None:
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    sync_engine = pg_hybrid._engine
+    async_engine = pg_hybrid._async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _count_inserts)
+    event.listen(async_engine, "before_cursor_execute", _count_inserts)
+    try:
+        pg_hybrid.add(hybrid_node_embeddings)
+        assert len(inserts) == 1
+
+        await pg_hybrid.async_add(hybrid_node_embeddings)
+        assert len(inserts) == 2
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count_inserts)
+        event.remove(async_engine, "before_cursor_execute", _count_inserts)
 
 
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
 @pytest.mark.asyncio
-@pytest.mark.parametrize("use_async", [True, False])
-async def test_add_to_db_and_hybrid_query_with_metadata_filters(
+async def test_bulk_copy_add(
     pg_hybrid: PGVectorStore,
     hybrid_node_embeddings: List[NodeWithEmbedding],
-    use_async: bool,
+    query_top1_ten: VectorStoreQuery,
+    hybrid_query_filtered: VectorStoreQuery,
 ) -> None:
-    if use_async:
-        await pg_hybrid.async_add(hybrid_node_embeddings)
-    else:
-        pg_hybrid.add(hybrid_node_embeddings)
-    assert isinstance(pg_hybrid, PGVectorStore)
-    filters = MetadataFilters(
-        filters=[ExactMatchFilter(key="test_key", value="test_value")]
-    )
-    q = VectorStoreQuery(
-        query_embedding=_get_sample_vector(0.1),
-        query_str="fox",
-        similarity_top_k=10,
-        filters=filters,
-        mode=VectorStoreQueryMode.HYBRID,
-    )
-    if use_async:
-        res = await pg_hybrid.aquery(q)
-    else:
-        res = pg_hybrid.query(q)
-    assert res.nodes
-    assert len(res.nodes) == 2
-    assert res.nodes[0].node_id == "bbb"
-    assert res.nodes[1].node_id == "ddd"
+    async def _check_copied_rows() -> None:
+        assert _count_rows(pg_hybrid) == len(hybrid_node_embeddings)
+
+        # an exact dense match only comes back if the embedding survived the copy
+        res = await pg_hybrid.aquery(query_top1_ten)
+        assert res.nodes
+        assert [node.node_id for node in res.nodes] == ["ddd"]
+        assert res.nodes[0].metadata == {"test_key": "test_value"}
+        assert res.nodes[0].ref_doc_id == "ddd"
+
+        # metadata filters and the generated text search column see copied rows
+        res = await pg_hybrid.aquery(hybrid_query_filtered)
+        assert res.nodes
+        assert [node.node_id for node in res.nodes] == ["bbb", "ddd"]
+
+    ids = pg_hybrid.bulk_copy_add(hybrid_node_embeddings)
+    assert ids == [node.id for node in hybrid_node_embeddings]
+    await _check_copied_rows()
+
+    _truncate_table(pg_hybrid)
+    ids = await pg_hybrid.async_bulk_copy_add(hybrid_node_embeddings)
+    assert ids == [node.id for node in hybrid_node_embeddings]
+    await _check_copied_rows()
 
 
-@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
 def test_hybrid_query_fails_if_no_query_str_provided(
-    pg_hybrid: PGVectorStore, hybrid_node_embeddings: List[NodeWithEmbedding]
+    pg_hybrid: PGVectorStore,
+    hybrid_node_embeddings: List[NodeWithEmbedding],
+    hybrid_query_no_query_str: VectorStoreQuery,
 ) -> None:
-    q = VectorStoreQuery(
-        query_embedding=_get_sample_vector(1.0),
-        similarity_top_k=10,
-        mode=VectorStoreQueryMode.HYBRID,
-    )
-
     with pytest.raises(Exception) as exc:
-        pg_hybrid.query(q)
+        pg_hybrid.query(hybrid_query_no_query_str)
 
         assert str(exc) == "query_str must be specified for a sparse vector query."